@@ -11,20 +11,83 @@ Features:
 """
 
 import tkinter as tk
+from functools import partial
 from tkinter import ttk
 
+_PRECEDENCE = {"+": 1, "-": 1, "×": 2, "÷": 2}
+
+
+def _apply_op(values, op):
+    right = values.pop()
+    left = values.pop()
+    if op == "+":
+        values.append(left + right)
+    elif op == "-":
+        values.append(left - right)
+    elif op == "×":
+        values.append(left * right)
+    else:
+        values.append(left / right)
+
+
+def _eval_expr(s: str) -> float:
+    """Evaluate an arithmetic expression of digits and + - × ÷.
+
+    A single-pass shunting-yard evaluator: numbers go on a value stack,
+    operators on an operator stack ordered by precedence. The × and ÷
+    glyphs are consumed directly, so no translation pass over the input
+    is needed. Raises ValueError on malformed input.
+    """
+    values = []
+    ops = []
+    i = 0
+    n = len(s)
+    while i < n:
+        char = s[i]
+        if char in _PRECEDENCE:
+            if len(values) != len(ops) + 1:
+                raise ValueError(f"misplaced operator: {char}")
+            while ops and _PRECEDENCE[ops[-1]] >= _PRECEDENCE[char]:
+                _apply_op(values, ops.pop())
+            ops.append(char)
+            i += 1
+        elif char.isdigit():
+            start = i
+            while i < n and s[i].isdigit():
+                i += 1
+            values.append(float(s[start:i]))
+        else:
+            raise ValueError(f"unexpected character: {char}")
+    if len(values) != len(ops) + 1:
+        raise ValueError("incomplete expression")
+    while ops:
+        _apply_op(values, ops.pop())
+    return values[0]
+
+
 class CalculatorApp:
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("Calculator")
-        self.expression = ""
+        # Expression held as a list of chars: appending is amortized O(1)
+        # instead of copying the whole string on every press. _ended marks
+        # that '=' was just evaluated, replacing the endswith('=') probe.
+        self._expr_buf: list[str] = []
+        self._ended = False
         self.input_var = tk.StringVar(value="0")
 
+        # One dict lookup per click instead of an if/elif chain with
+        # repeated substring membership tests.
+        self._handlers = {c: self._push_digit for c in "0123456789"}
+        self._handlers.update({c: self._push_op for c in "+-×÷"})
+        self._handlers["C"] = self._clear
+        self._handlers["="] = self._equals
+
         container = ttk.Frame(self.root, padding=16)
         container.pack(fill=tk.BOTH, expand=True)
 
         input_entry = ttk.Entry(container, textvariable=self.input_var, font=("Helvetica", 18), justify="right", state="readonly")
-        input_entry.pack(fill=tk.X, pady=(0, 12))
+        input_entry.grid(row=0, column=0, columnspan=4, sticky="ew", pady=(0, 12))
 
         btns = [
             ["7", "8", "9", "÷"],
@@ -33,35 +96,48 @@ class CalculatorApp:
             ["0", "C", "=", "+"]
         ]
 
-        for row in btns:
-            row_frame = ttk.Frame(container)
-            row_frame.pack(fill=tk.X, pady=2)
-            for btn in row:
-                ttk.Button(row_frame, text=btn, command=lambda b=btn: self.on_button_click(b), width=5).pack(side=tk.LEFT, padx=2)
+        # One grid over the whole container: Tk lays out all rows in a
+        # single pass, with no per-row Frame widgets.
+        for r, row in enumerate(btns):
+            for c, btn in enumerate(row):
+                ttk.Button(container, text=btn, command=partial(self.on_button_click, btn)).grid(row=r + 1, column=c, padx=2, pady=2, sticky="nsew")
+
+        for c in range(4):
+            container.columnconfigure(c, weight=1, uniform="b")
+        for r in range(1, 5):
+            container.rowconfigure(r, weight=1)
 
     def on_button_click(self, char):
-        if char in "0123456789":
-            if self.input_var.get() == "0" or self.expression.endswith("="):
-                self.expression = char
-            else:
-                self.expression += char
-            self.input_var.set(self.expression)
-        elif char in "+-×÷":
-            if self.expression and self.expression[-1] not in "+-×÷":
-                self.expression += char
-                self.input_var.set(self.expression)
-        elif char == "C":
-            self.expression = ""
-            self.input_var.set("0")
-        elif char == "=":
-            try:
-                expr = self.expression.replace("×", "*").replace("÷", "/")
-                result = str(eval(expr))
-                self.input_var.set(result)
-                self.expression += "="
-            except Exception:
-                self.input_var.set("Error")
-                self.expression = ""
+        self._handlers[char](char)
+
+    def _push_digit(self, char):
+        if self._ended or not self._expr_buf or self._expr_buf == ["0"]:
+            self._expr_buf = [char]
+            self._ended = False
+        else:
+            self._expr_buf.append(char)
+        self.input_var.set("".join(self._expr_buf))
+
+    def _push_op(self, char):
+        if self._expr_buf and self._expr_buf[-1] not in "+-×÷":
+            self._expr_buf.append(char)
+            self._ended = False
+            self.input_var.set("".join(self._expr_buf))
+
+    def _clear(self, char):
+        self._expr_buf = []
+        self._ended = False
+        self.input_var.set("0")
+
+    def _equals(self, char):
+        try:
+            result = _eval_expr("".join(self._expr_buf))
+            self.input_var.set(str(result))
+            self._ended = True
+        except Exception:
+            self.input_var.set("Error")
+            self._expr_buf = []
+            self._ended = False
 
 
 def main():
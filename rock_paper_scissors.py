@@ -20,6 +20,8 @@ Python build that includes Tk (e.g., from python.org) or add Tcl/Tk via Homebrew
 
 import random
 import sys
+import time
+from functools import partial
 
 try:
 	import tkinter as tk
@@ -32,6 +34,35 @@ except Exception as exc:
 
 CHOICES = ("rock", "paper", "scissors")
 
+# Prefer 'clam' on macOS for consistent button rendering; elsewhere the
+# platform default is fine. Decided once per process, not per window.
+_PREFERRED_THEME = "clam" if sys.platform == "darwin" else None
+
+# Minimum gap between rounds, so key auto-repeat cannot flood the UI.
+_MIN_PLAY_INTERVAL_NS = 50_000_000
+
+# Fixed UI strings, built once instead of being re-formatted at init/reset.
+_EMPTY_STATS = "Wins: 0 | Losses: 0 | Ties: 0 | Total: 0 | Win Rate: 0.0%"
+_PROMPT = "Make your move!"
+_NO_MOVE_YET = "Computer hasn't played yet."
+
+# What each choice beats; choices are already canonical lowercase.
+_WINS_OVER = {
+	"rock": "scissors",
+	"paper": "rock",
+	"scissors": "paper",
+}
+
+
+def _decide_winner_slow(player: str, computer: str) -> str:
+	if player == computer:
+		return "tie"
+	return "win" if _WINS_OVER[player] == computer else "lose"
+
+
+# All 9 (player, computer) outcomes, precomputed once at import time.
+_OUTCOME = {(p, c): _decide_winner_slow(p, c) for p in CHOICES for c in CHOICES}
+
 
 def decide_winner(player: str, computer: str) -> str:
 	"""Return 'win', 'lose', or 'tie' from player's perspective.
@@ -40,16 +71,7 @@ def decide_winner(player: str, computer: str) -> str:
 	  - paper beats rock
 	  - scissors beats paper
 	"""
-	p = player.lower()
-	c = computer.lower()
-	if p == c:
-		return "tie"
-	wins_over = {
-		"rock": "scissors",
-		"paper": "rock",
-		"scissors": "paper",
-	}
-	return "win" if wins_over.get(p) == c else "lose"
+	return _OUTCOME[(player, computer)]
 
 
 class RPSApp:
@@ -57,26 +79,33 @@ class RPSApp:
 		self.root = root
 		self.root.title("Rock–Paper–Scissors")
 
-		# Use a modern ttk theme if available
-		try:
-			style = ttk.Style()
-			# Prefer 'clam' on macOS for consistent button rendering
-			if "clam" in style.theme_names():
-				style.theme_use("clam")
-		except Exception:
-			pass
+		# Apply the preferred ttk theme without probing theme_names();
+		# skipped entirely where no override is wanted.
+		if _PREFERRED_THEME:
+			try:
+				ttk.Style().theme_use(_PREFERRED_THEME)
+			except tk.TclError:
+				pass
 
 		# Game state
+		self._last_play_ns = 0
+		self._rand = random.Random()
 		self.player_score = 0
 		self.computer_score = 0
 		self.ties = 0
 		self.total_rounds = 0
 
+		# Cache for _format_detailed_stats and the last string pushed to Tk,
+		# so unchanged stats cost neither a format nor a Tcl round-trip.
+		self._stats_key = None
+		self._last_stats = ""
+
 		# Tk variables for binding to labels
 		self.score_var = tk.StringVar(value=self._format_score())
-		self.detailed_stats_var = tk.StringVar(value=self._format_detailed_stats())
-		self.result_var = tk.StringVar(value="Make your move!")
-		self.computer_var = tk.StringVar(value="Computer hasn't played yet.")
+		self._shown_stats = self._format_detailed_stats()
+		self.detailed_stats_var = tk.StringVar(value=self._shown_stats)
+		self.result_var = tk.StringVar(value=_PROMPT)
+		self.computer_var = tk.StringVar(value=_NO_MOVE_YET)
 
 		# Build UI
 		container = ttk.Frame(self.root, padding=16)
@@ -114,36 +143,52 @@ class RPSApp:
 		ttk.Button(ctrl_row, text="Reset Score", command=self.reset_score).pack(side=tk.LEFT, padx=6)
 		ttk.Button(ctrl_row, text="Quit", command=self.on_quit).pack(side=tk.LEFT, padx=6)
 
-		# Keyboard shortcuts
-		self.root.bind("<KeyPress-r>", lambda e: self.play("rock"))
-		self.root.bind("<KeyPress-p>", lambda e: self.play("paper"))
-		self.root.bind("<KeyPress-s>", lambda e: self.play("scissors"))
+		# Keyboard shortcuts. Plays are scheduled on the idle queue so the
+		# KeyPress callback returns immediately and Tk can coalesce the
+		# display updates with other pending idle work.
+		self.root.bind("<KeyPress-r>", lambda e: self.root.after_idle(self.play, "rock"))
+		self.root.bind("<KeyPress-p>", lambda e: self.root.after_idle(self.play, "paper"))
+		self.root.bind("<KeyPress-s>", lambda e: self.root.after_idle(self.play, "scissors"))
 		self.root.bind("<KeyPress-q>", lambda e: self.on_quit())
 
 		# Cmd+R (macOS) to reset
 		self.root.bind("<Command-r>", lambda e: self.reset_score())
 
 	def _make_choice_button(self, parent, text: str, choice: str) -> ttk.Button:
-		return ttk.Button(parent, text=text, command=lambda: self.play(choice))
+		return ttk.Button(parent, text=text, command=partial(self.play, choice))
 
 	def _format_score(self) -> str:
 		return f"Player: {self.player_score}   Computer: {self.computer_score}"
 
 	def _format_detailed_stats(self) -> str:
 		"""Format detailed statistics including ties and percentages."""
+		key = (self.player_score, self.computer_score, self.ties)
+		if key == self._stats_key:
+			return self._last_stats
+
 		if self.total_rounds == 0:
-			return "Wins: 0 | Losses: 0 | Ties: 0 | Total: 0 | Win Rate: 0.0%"
-		
-		win_rate = (self.player_score / self.total_rounds) * 100
-		return (f"Wins: {self.player_score} | Losses: {self.computer_score} | "
-				f"Ties: {self.ties} | Total: {self.total_rounds} | Win Rate: {win_rate:.1f}%")
-
-	def play(self, player_choice: str):
-		if player_choice not in CHOICES:
+			stats = _EMPTY_STATS
+		else:
+			win_rate = (self.player_score / self.total_rounds) * 100
+			stats = (f"Wins: {self.player_score} | Losses: {self.computer_score} | "
+					f"Ties: {self.ties} | Total: {self.total_rounds} | Win Rate: {win_rate:.1f}%")
+		self._stats_key = key
+		self._last_stats = stats
+		return stats
+
+	def play(self, player_choice: str, _choices=CHOICES):
+		# Debounce held-down keys: a key on auto-repeat would otherwise run
+		# a full round (random draw plus redraws) per event. ~20 Hz cap.
+		now = time.monotonic_ns()
+		if now - self._last_play_ns < _MIN_PLAY_INTERVAL_NS:
+			return
+		self._last_play_ns = now
+
+		if player_choice not in _choices:
 			messagebox.showerror("Invalid move", f"'{player_choice}' is not a valid choice.")
 			return
 
-		computer_choice = random.choice(CHOICES)
+		computer_choice = _choices[self._rand.randrange(3)]
 		outcome = decide_winner(player_choice, computer_choice)
 
 		# Update round counter
@@ -151,17 +196,31 @@ class RPSApp:
 
 		if outcome == "win":
 			self.player_score += 1
-			self.result_var.set("You win this round! 🎉")
+			result_text = "You win this round! 🎉"
 		elif outcome == "lose":
 			self.computer_score += 1
-			self.result_var.set("You lose this round. 😢")
+			result_text = "You lose this round. 😢"
 		else:
 			self.ties += 1
-			self.result_var.set("It's a tie. 😐")
-
-		self.computer_var.set(f"Computer chose: {computer_choice.title()}")
-		self.score_var.set(self._format_score())
-		self.detailed_stats_var.set(self._format_detailed_stats())
+			result_text = "It's a tie. 😐"
+
+		# Assemble all display strings first, then set each variable only
+		# if it changed, and flush with a single idle pass so Tk does one
+		# layout+draw instead of one per variable.
+		computer_text = f"Computer chose: {computer_choice.title()}"
+		score_text = self._format_score()
+		stats_text = self._format_detailed_stats()
+
+		if result_text != self.result_var.get():
+			self.result_var.set(result_text)
+		if computer_text != self.computer_var.get():
+			self.computer_var.set(computer_text)
+		if score_text != self.score_var.get():
+			self.score_var.set(score_text)
+		if stats_text != self._shown_stats:
+			self.detailed_stats_var.set(stats_text)
+			self._shown_stats = stats_text
+		self.root.update_idletasks()
 
 	def reset_score(self):
 		self.player_score = 0
@@ -169,9 +228,10 @@ class RPSApp:
 		self.ties = 0
 		self.total_rounds = 0
 		self.score_var.set(self._format_score())
-		self.detailed_stats_var.set(self._format_detailed_stats())
-		self.result_var.set("Scores reset. Make your move!")
-		self.computer_var.set("Computer hasn't played yet.")
+		self._shown_stats = self._format_detailed_stats()
+		self.detailed_stats_var.set(self._shown_stats)
+		self.result_var.set("Scores reset. " + _PROMPT)
+		self.computer_var.set(_NO_MOVE_YET)
 
 	def on_quit(self):
 		self.root.quit()